@@ -8,6 +8,11 @@ __version__ = "1.0.1"  # last edit: 20.07.2021
 
 __all__ = [
     "enable_ANSI_esc_seq",
+    "is_headless",
+    "set_headless",
+    "set_replay",
+    "load_replay",
+    "replay_answer",
     "getch",
     "CursorPosition",
     "get_cursor_position",
@@ -15,6 +20,7 @@ __all__ = [
     "flush",
     "yesno",
     "param",
+    "params",
     "vline",
     "Selector",
     "askinput",
@@ -22,6 +28,8 @@ __all__ = [
     "console_input",
     "notepad_input",
     "getpass",
+    "getpass_bytes",
+    "SecretBuffer",
     "pause",
     "Timer",
     "InteractiveConsole",
@@ -29,6 +37,11 @@ __all__ = [
 
 from ._main import (
     enable_ANSI_esc_seq,
+    is_headless,
+    set_headless,
+    set_replay,
+    load_replay,
+    replay_answer,
     getch,
     CursorPosition,
     get_cursor_position,
@@ -36,6 +49,7 @@ from ._main import (
     flush,
     yesno,
     param,
+    params,
     vline,
     pause,
     Timer,
@@ -47,13 +61,16 @@ from ._interactive_console import InteractiveConsole
 
 from ._input import askinput, askpath, console_input, notepad_input
 
-from ._getpass import getpass
+from ._getpass import getpass, getpass_bytes, SecretBuffer
 
 
 # -----=========-----
 #      AUTO INIT
 # -----=========-----
-enable_ANSI_esc_seq()
+load_replay()
+
+if not is_headless():
+    enable_ANSI_esc_seq()
 
 # set code page to UTF-8
 try:
@@ -4,13 +4,86 @@
     This file contains the getpass functions.
 """
 
-from ._main import out, getch
+from ._main import out, getch, is_headless, replay_answer
 
-from sys import stdout
 from msvcrt import kbhit
 
 
-def getpass(prompt: str = "Password: ", mask: str = "*") -> str:
+# -----=============-----
+#      SECRET BUFFER
+# -----=============-----
+class SecretBuffer:
+    """
+    A preallocated buffer that holds a secret as UTF-8 encoded bytes.
+
+    The data is never copied into immutable objects unless `bytes(buffer)` or `decode()`
+    is called and it is overwritten with zeros by `wipe()`. Use it as a context
+    manager to make sure it gets wiped:
+
+        with getpass_bytes() as secret:
+            login(secret.view())
+    """
+
+    def __init__(self, size: int = 256):
+        self._data = bytearray(size)
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __enter__(self) -> "SecretBuffer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.wipe()
+
+    def append(self, data: bytes) -> None:
+        end = self._length + len(data)
+        if end > len(self._data):  # grow into a new buffer, the old one gets wiped
+            old = self._data
+            self._data = bytearray(max(end, 2 * len(old)))
+            self._data[: self._length] = old[: self._length]
+            old[:] = bytes(len(old))
+        self._data[self._length : end] = data
+        self._length = end
+
+    def pop(self) -> bool:
+        """
+        Remove the last character. Returns False if the buffer was empty.
+        """
+        if not self._length:
+            return False
+        start = self._length - 1
+        while start and self._data[start] & 0xC0 == 0x80:  # UTF-8 continuation byte
+            start -= 1
+        self._data[start : self._length] = bytes(self._length - start)
+        self._length = start
+        return True
+
+    def view(self) -> memoryview:
+        """
+        A memoryview of the secret without copying it.
+        It should be released before the buffer grows or gets wiped.
+        """
+        return memoryview(self._data)[: self._length]
+
+    def __bytes__(self) -> bytes:
+        with self.view() as view:
+            return bytes(view)
+
+    def decode(self) -> str:
+        with self.view() as view:
+            return str(view, "utf-8", "replace")
+
+    def wipe(self) -> None:
+        self._data[:] = bytes(len(self._data))
+        self._length = 0
+
+
+# -----=======-----
+#      GETPASS
+# -----=======-----
+def _read_secret(prompt: str, mask: str, buffer: SecretBuffer) -> None:
 
     if not isinstance(prompt, str):
         raise TypeError("prompt must be a string")
@@ -19,21 +92,38 @@ def getpass(prompt: str = "Password: ", mask: str = "*") -> str:
     if not len(mask) == 1:
         raise ValueError("mask must have a length of 1")
 
-    pswd: list[str] = []
-
     out(prompt, flush=True)
 
+    if is_headless():
+        try:
+            answer = replay_answer(prompt)
+        except EOFError:
+            out("\n")
+            raise KeyboardInterrupt
+        buffer.append(answer.encode())
+        out(mask * len(answer), "\n")
+        return
+
+    pending = 0  # number of masks that were not written yet
+
     while True:
+        # pasted or buffered input is echoed in one write once all keys were read
+        if pending and not kbhit():
+            out(mask * pending, flush=True)
+            pending = 0
+
         key = getch()
 
         if key in (b"\r", b"\n"):
-            out("\n", flush=True)
-            return "".join(pswd)
+            out(mask * pending, "\n", flush=True)
+            return
 
         elif key == b"\b":
-            stdout.write("\b \b")
-            stdout.flush()
-            pswd.pop()
+            if buffer.pop():
+                if pending:
+                    pending -= 1
+                else:
+                    out("\b \b", flush=True)
             continue
 
         elif key in (b"\xe0", b"\x00") and kbhit():
@@ -66,12 +156,32 @@ def getpass(prompt: str = "Password: ", mask: str = "*") -> str:
         #     stdout.flush()
         #     continue
 
-        stdout.write("*")
-        stdout.flush()
+        # read the remaining bytes of a multi byte UTF-8 character
+        lead = key[0]
+        for _ in range(3 if lead >= 0xF0 else 2 if lead >= 0xE0 else 1 if lead >= 0xC0 else 0):
+            if not kbhit():
+                break
+            key += getch()
 
-        try:
-            pswd.append(key.decode())
-        except UnicodeDecodeError:
-            while kbhit():
-                key += getch()
-            pswd.append(key.decode())
+        buffer.append(key)
+        pending += 1
+
+
+def getpass(prompt: str = "Password: ", mask: str = "*") -> str:
+    with SecretBuffer() as buffer:
+        _read_secret(prompt, mask, buffer)
+        return buffer.decode()
+
+
+def getpass_bytes(prompt: str = "Password: ", mask: str = "*", size: int = 256) -> SecretBuffer:
+    """
+    Like getpass but the secret is returned as a SecretBuffer of `size` preallocated bytes.
+    The caller is responsible for wiping it, e.g. by using it as a context manager.
+    """
+    buffer = SecretBuffer(size)
+    try:
+        _read_secret(prompt, mask, buffer)
+    except BaseException:
+        buffer.wipe()
+        raise
+    return buffer
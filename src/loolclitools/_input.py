@@ -6,10 +6,13 @@
 """
 
 import os
+import stat
 from io import BufferedReader
-from ._main import out, flush, getch, vline, get_cursor_position
+from msvcrt import getch as _getch, kbhit
+from threading import Lock, Thread
+from ._main import out, flush, getch, vline, get_cursor_position, is_headless, replay_answer
 from ._getpass import getpass
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 NOTEPAD_PATH = os.path.join(os.getenv("windir"), "System32", "notepad.exe")
@@ -22,7 +25,18 @@ def askinput(prompt: str = "", is_password: bool = False) -> str:
     """
     A function for getting input from the user.
     If `is__password` is True the input will be masked with '*'.
+    In headless mode the answer is taken from replay_answer().
     """
+    if is_headless():
+        out(f"  {prompt}")
+        try:
+            result = replay_answer(prompt)
+        except EOFError:
+            out("\n")
+            raise KeyboardInterrupt
+        out("*" * len(result) if is_password else result, "\n")
+        return result
+
     out("\x1b[0m")
     try:
         result = (getpass if is_password else input)(f"\x1b[2C{prompt}\x1b[96m")
@@ -36,35 +50,221 @@ def askinput(prompt: str = "", is_password: bool = False) -> str:
         return result
 
 
+# -----===============-----
+#      PATH COMPLETION
+# -----===============-----
+class _DirectoryIndex:
+    """
+    Caches directory listings for the tab completion of askpath.
+
+    Listings are created with os.scandir in a background thread and are only
+    recreated when the mtime of the directory changed, so the prompt never
+    has to wait for a slow file system.
+    """
+
+    def __init__(self):
+        self.__cache: Dict[str, Tuple[Optional[int], Tuple[str, ...]]] = {}  # directory -> (mtime, names)
+        self.__pending: Dict[str, Thread] = {}
+        self.__lock = Lock()
+
+    def prefetch(self, directory: str) -> None:
+        """
+        Start listing `directory` in the background if it is not cached yet.
+        """
+        with self.__lock:
+            if directory in self.__cache:
+                return
+        self.__refresh(directory)
+
+    def get(self, directory: str, timeout: float = 0.1) -> Tuple[str, ...]:
+        """
+        Return the names inside `directory`, subdirectories end with os.sep.
+        Waits at most `timeout` seconds for the background refresh, if it takes
+        longer the previous (possibly outdated) listing is returned.
+        """
+        self.__refresh(directory).join(timeout)
+        with self.__lock:
+            return self.__cache.get(directory, (None, ()))[1]
+
+    def __refresh(self, directory: str) -> Thread:
+        with self.__lock:
+            thread = self.__pending.get(directory)
+            if thread is None:
+                thread = self.__pending[directory] = Thread(target=self.__scan, args=(directory,), daemon=True)
+                thread.start()
+        return thread
+
+    def __scan(self, directory: str) -> None:
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            with self.__lock:
+                cached = self.__cache.get(directory)
+            if cached is not None and cached[0] == mtime:
+                return  # listing is still up to date
+            names = []
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    names.append(entry.name + os.sep if is_dir else entry.name)
+            names.sort(key=str.lower)
+            with self.__lock:
+                self.__cache[directory] = (mtime, tuple(names))
+        except OSError:
+            with self.__lock:
+                self.__cache[directory] = (None, ())
+        finally:
+            with self.__lock:
+                del self.__pending[directory]
+
+
+_path_index = _DirectoryIndex()
+
+
+def _split_path(text: str) -> Tuple[str, str]:
+    """
+    Split `text` into the part up to the last separator and the name that is being typed.
+    """
+    name = os.path.basename(text)
+    return text[: len(text) - len(name)], name
+
+
+def _askpath_input(prompt: str) -> str:
+    """
+    Like askinput but TAB and SHIFT+TAB cycle through the matching entries of the
+    typed directory. The cursor position has to be saved at the start of the prompt line.
+    """
+    # getch() would swallow the key after TAB (CTRL+I + CTRL+C starts an interactive console),
+    # therefore msvcrt.getch is used and that shortcut is handled here
+    from ._interactive_console import InteractiveConsole
+
+    text = ""
+    prev_key = None
+    prev_stem = None
+    matches: Optional[List[str]] = None
+    match_index = 0
+    base = ""
+
+    def redraw(clear: str = "\x1b[J"):
+        out(f"\x1b[u\x1b[0m\x1b[2C{prompt}\x1b[96m{text}{clear}", flush=True)
+
+    redraw("")  # keep the error message of askpath below the prompt
+
+    while True:
+        key = _getch()
+
+        if key in (b"\r", b"\n"):
+            out("\x1b[0m\n", flush=True)
+            return text
+
+        elif key == b"\x03" and prev_key == b"\t":  # CTRL+I and CTRL+C
+            InteractiveConsole()
+            prev_key = None
+            redraw()
+            continue
+
+        elif key in (b"\x03", b"\x1b"):  # CTRL+C, ESC
+            out("\n\x1b[J\x1b[0m\x1b[2D")
+            raise KeyboardInterrupt
+
+        elif key in (b"\xe0", b"\x00") and _getch() != b"\x0f":  # special keys except SHIFT+TAB are ignored
+            prev_key = key
+            continue
+
+        elif key in (b"\t", b"\xe0", b"\x00"):  # TAB, SHIFT+TAB
+            step = 1 if key == b"\t" else -1
+            prev_key = b"\t"
+            if matches is None:
+                quote = '"' if text.startswith('"') else ""
+                stem, name = _split_path(text[len(quote) :])
+                needle = os.path.normcase(name)
+                matches = [
+                    entry
+                    for entry in _path_index.get(os.path.abspath(stem or os.curdir))
+                    if os.path.normcase(entry).startswith(needle)
+                ]
+                if not matches:
+                    matches = None
+                    out("\a", flush=True)
+                    continue
+                base = quote + stem
+                match_index = -1 if step == 1 else 0
+            match_index = (match_index + step) % len(matches)
+            text = base + matches[match_index]
+            redraw()
+            continue
+
+        elif key == b"\b":
+            if text:
+                text = text[:-1]
+                out("\b \b", flush=True)
+
+        else:
+            try:
+                char = key.decode()
+            except UnicodeDecodeError:
+                while kbhit():
+                    key += _getch()
+                char = key.decode(errors="replace")
+            if not char.isprintable():
+                prev_key = key
+                continue
+            text += char
+            out(char, flush=True)
+
+        InteractiveConsole.temporary_globals.clear()
+        prev_key = key
+        matches = None
+
+        # list the directory that is currently typed in the background
+        stem = _split_path(text.lstrip('"'))[0]
+        if stem != prev_stem:
+            prev_stem = stem
+            _path_index.prefetch(os.path.abspath(stem or os.curdir))
+
+
 # -----==========-----
 #      PATH INPUT
 # -----==========-----
-def askpath(prompt: str, /, must_be_file: bool = False, must_be_dir: bool = False) -> str:
+def askpath(prompt: str, /, must_be_file: bool = False, must_be_dir: bool = False, completion: bool = False) -> str:
     """
     A function for getting a path from the user.
 
     If `must_be_file` is True only files are accepted.
     If `must_be_dir` is True only directories are accepted.
+    If `completion` is True, TAB and SHIFT+TAB complete the typed path. The path is then read
+    by a simple line editor which only supports typing and backspace, no cursor movement or history.
+    In headless mode an invalid answer raises a ValueError instead of asking again.
     """
+    headless = is_headless()
     out("\x1b[0m\x1b[s")
 
     def err(msg):
+        if headless:  # the same answer might be replayed again and again
+            raise ValueError(msg)
         return out(f"\x1b[B\x1b[2C\x1b[J\x1b[91m{msg}\x1b[0m\x1b[u\x1b[K")
 
     while True:
-        filepath = askinput(prompt)
+        filepath = _askpath_input(prompt) if completion and not headless else askinput(prompt)
         # remove ' and ' from start and end
         if filepath and filepath[0] in (""", """) and filepath[-1] in (""", """):
             filepath = filepath[1:-1]
         # validate
         if not filepath:
+            if headless:
+                raise ValueError("No path was given!")
             out("\x1b[A\x1b[K")
             continue
-        elif not os.path.exists(filepath):
+        try:
+            mode = os.stat(filepath).st_mode  # only one stat, it is slow on network drives
+        except (OSError, ValueError):
             err(f"This " + ("file" if must_be_file else "directory" if must_be_dir else "path") + " does not exist!")
-        elif must_be_file and not os.path.isfile(filepath):
+            continue
+        if must_be_file and not stat.S_ISREG(mode):
             err(f"The specified path is not a file!")
-        elif must_be_dir and not os.path.isdir(filepath):
+        elif must_be_dir and not stat.S_ISDIR(mode):
             err(f"The specified path is not a directory!")
         else:
             out("\x1b[0m\x1b[J")
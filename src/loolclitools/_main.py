@@ -6,9 +6,14 @@
 
 import sys
 import os
+import re
+import json
+import shutil
+from collections import deque
+from itertools import chain, islice
 from time import perf_counter
 from msvcrt import getch as _getch, kbhit
-from typing import Any, NamedTuple
+from typing import Any, Deque, Dict, Iterable, Mapping, NamedTuple, Optional, Tuple, Union
 
 
 # -----=======================-----
@@ -28,6 +33,77 @@ def enable_ANSI_esc_seq() -> None:
 
 
 
+# -----=============-----
+#      HEADLESS MODE
+# -----=============-----
+_headless = os.getenv("LOOLCLITOOLS_HEADLESS", "") not in ("", "0") or not sys.stdout.isatty()
+_ANSI_ESC_SEQ = re.compile(r"\x1b(?:\[[0-9;?]*[A-Za-z]|\([0-9A-Z]|!p|[78])")
+_replay_answers: Deque[str] = deque()
+_replay_mapping: Dict[str, str] = {}
+
+
+def is_headless() -> bool:
+    """
+    Returns True if no console is used, e.g. when stdout is a pipe or LOOLCLITOOLS_HEADLESS is set.
+    In headless mode no escape sequences are written and prompts are answered by replay_answer().
+    """
+    return _headless
+
+
+def set_headless(value: Optional[bool] = None) -> None:
+    """
+    Enable or disable the headless mode. None restores the automatic detection.
+    """
+    global _headless
+    _headless = (not sys.stdout.isatty()) if value is None else value
+
+
+def _replay_key(prompt: str) -> str:
+    return prompt.strip().rstrip(":").rstrip()
+
+
+def set_replay(answers: Union[Iterable[str], Mapping[str, str]]) -> None:
+    """
+    Add answers for the prompts in headless mode.
+    A mapping assigns answers to prompts (or Selector titles), other iterables are used in order.
+    """
+    if isinstance(answers, Mapping):
+        _replay_mapping.update((_replay_key(k), str(v)) for k, v in answers.items())
+    else:
+        _replay_answers.extend(map(str, answers))
+
+
+def load_replay() -> None:
+    """
+    Load the answers from the file LOOLCLITOOLS_REPLAY (one answer per line)
+    and the JSON object LOOLCLITOOLS_ANSWERS (prompt -> answer).
+    """
+    path = os.getenv("LOOLCLITOOLS_REPLAY")
+    if path:
+        with open(path, encoding="utf-8") as file:
+            set_replay(file.read().splitlines())
+    mapping = os.getenv("LOOLCLITOOLS_ANSWERS")
+    if mapping:
+        set_replay(json.loads(mapping))
+
+
+def replay_answer(prompt: str) -> str:
+    """
+    Returns the answer for `prompt` in headless mode.
+    Answers assigned to the prompt are preferred, then the next answer in order, then a line from stdin.
+    """
+    key = _replay_key(prompt)
+    if key in _replay_mapping:
+        return _replay_mapping[key]
+    if _replay_answers:
+        return _replay_answers.popleft()
+    sys.stdout.flush()  # the prompt has to be visible for whoever writes to stdin
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\r\n")
+
+
 # -----==============-----
 #      MODIFIED GETCH
 # -----==============-----
@@ -71,8 +147,10 @@ def get_cursor_position() -> CursorPosition:
 def out(*text: Any, sep: str = "", flush: bool = False) -> None:
     """
     Just like sys.stdout.write() but with a bit more functionality.
+    In headless mode escape sequences are removed.
     """
-    sys.stdout.write(sep.join(map(str, text)))
+    text = sep.join(map(str, text))
+    sys.stdout.write(_ANSI_ESC_SEQ.sub("", text) if _headless else text)
     if flush:
         sys.stdout.flush()
 
@@ -98,13 +176,61 @@ def param(name: str, value: str, ljust: int = None) -> None:
     name += ": "
     if ljust:
         name = name.ljust(ljust)
-    out(f"\x1b[0m\x1b[2C{name}\x1b[96m{value}\x1b[0m\n")
+    if _headless:
+        sys.stdout.write(f"  {name}{value}\n")
+    else:
+        out(f"\x1b[0m\x1b[2C{name}\x1b[96m{value}\x1b[0m\n")
+
+
+def params(
+    rows: Union[Iterable[Tuple[str, Any]], Mapping[str, Any]],
+    sample: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> None:
+    """
+    Print many keys and values like param() with the values aligned in one column.
+
+    The column width is computed in one pass over all rows, for long iterators `sample` limits
+    this to the first `sample` rows. Lines are truncated to the console width (not in headless mode)
+    and written at once, if `chunk_size` is set they are written and flushed every `chunk_size` rows instead.
+    Then `sample` defaults to `chunk_size`, so iterators are not read completely before the first write.
+    """
+    if isinstance(rows, Mapping):
+        rows = rows.items()
+    if chunk_size and sample is None:
+        sample = chunk_size
+    rows = ((f"{name}: ", str(value)) for name, value in rows)
+    head = list(rows if sample is None else islice(rows, sample))
+    columns = None if _headless else os.get_terminal_size().columns - 3  # nothing is lost in files and pipes
+    width = max((len(name) for name, _ in head), default=0)
+    if columns is not None:
+        width = min(width, columns // 2)  # the values keep at least half of the line
+    template = "  {}{}\n" if _headless else "\x1b[2C{}\x1b[96m{}\x1b[0m\n"
+
+    if not _headless:
+        sys.stdout.write("\x1b[0m")
+    lines = []
+    for name, value in chain(head, rows):
+        if columns is not None:
+            name = name[:width]
+            value = value[: columns - width]
+        name = name.ljust(width)
+        lines.append(template.format(name, value))
+        if chunk_size and len(lines) >= chunk_size:
+            sys.stdout.write("".join(lines))
+            flush()
+            lines.clear()
+    sys.stdout.write("".join(lines))
+    if chunk_size:
+        flush()
 
 
 def vline() -> str:
     """
     Returns a vertical line that is as long as the console currently is.
     """
+    if _headless:
+        return "-" * (shutil.get_terminal_size().columns - 1)
     return "\x1b(0" + "q" * (os.get_terminal_size().columns - 1) + "\x1b(B"
 
 
@@ -114,7 +240,10 @@ def vline() -> str:
 def pause():
     """
     Pause the program, clean up some things and exit.
+    In headless mode it returns immediately.
     """
+    if _headless:
+        return
     out("\n\x1b[0mPress any key to exit . . . ")
     flush()
     while kbhit():
@@ -2,15 +2,33 @@
 
 import sys
 import os
-from ._main import getch, flush
+from ._main import getch, flush, is_headless, replay_answer
 from typing import List
 
 
+_INVERT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
 class Selector:  # use sys.stdout.write instead of out here for performance reasons
     def __init__(
-        self, entries: List[str], title: str = None, select: str = ">", print_result: bool = True, start_pos: int = None
+        self,
+        entries: List[str],
+        title: str = None,
+        select: str = ">",
+        print_result: bool = True,
+        start_pos: int = None,
+        multi: bool = False,
     ):
-        """`entries` - Each None or '' will be a blank line."""
+        """
+        `entries` - Each None or '' will be a blank line.
+        `multi` - Multiple entries can be selected: SPACE toggles the current entry, A selects all,
+                  N selects none, I inverts the selection and R sets all entries between the last
+                  toggled and the current one to the state of the last toggled one.
+                  `result` is then a list of the selected entries and `selection` contains a 1 for
+                  each selected entry.
+        In headless mode the answer is taken from replay_answer(title): an entry, its number
+        or, if `multi` is True, a comma separated list of those or '*' for all entries.
+        """
 
         # replace '' with None; None means empty line
         entries = tuple(i or None for i in entries)
@@ -28,6 +46,14 @@ class Selector:  # use sys.stdout.write instead of out here for performance reas
             self.__empty_line_indexes.add(entries.index(None) - 1)
             entries.remove(None)
         self.pos = self.prev = 0
+        self.multi = multi
+        self.selection = bytearray(len(self.entries)) if multi else None
+        self.__anchor = None  # last toggled entry
+
+        if is_headless():
+            self.__replay(print_result, start_pos)
+            return
+
         self.__prev_terminal_size = os.get_terminal_size().lines
 
         sys.stdout.write("\x1b[0m\x1b[?25l")
@@ -58,9 +84,26 @@ class Selector:  # use sys.stdout.write instead of out here for performance reas
             elif char == b"s":
                 self.__down()
 
+            elif multi and char == b" ":
+                self.selection[self.pos] ^= 1
+                self.__anchor = self.pos
+            elif multi and char in (b"a", b"A"):
+                self.selection[:] = b"\x01" * len(self.selection)
+                self.__repaint()
+            elif multi and char in (b"n", b"N"):
+                self.selection[:] = bytes(len(self.selection))
+                self.__repaint()
+            elif multi and char in (b"i", b"I"):
+                self.selection = self.selection.translate(_INVERT)
+                self.__repaint()
+            elif multi and char in (b"r", b"R") and self.__anchor is not None:
+                start, end = sorted((self.__anchor, self.pos))
+                self.selection[start : end + 1] = self.selection[self.__anchor : self.__anchor + 1] * (end - start + 1)
+                self.__repaint()
+
             # numbers
             elif char in b"123456789":
-                if self.__select_element(int(char)):  # pos was changed
+                if self.__select_element(int(char)) and not multi:  # pos was changed
                     break
 
             elif char == b"\r":  # enter
@@ -77,14 +120,46 @@ class Selector:  # use sys.stdout.write instead of out here for performance reas
                 raise KeyboardInterrupt
 
         # exit Selector
-        self.result = self.entries[self.pos]
+        result = self.__set_result()
         sys.stdout.write("\x1b[u\x1b[?25h")
         if print_result:
-            sys.stdout.write(f"\x1b[J{self.__title_end}\x1b[96m{self.entries[self.pos]}\x1b[0m\n")
+            sys.stdout.write(f"\x1b[J{self.__title_end}\x1b[96m{result}\x1b[0m\n")
         else:
             sys.stdout.write(f"\x1b[A\x1b[J" if title is not None else f"\x1b[J")
             flush()  # no new line at the end so flushing is required
 
+    def __replay(self, print_result: bool, start_pos: int = None) -> None:
+        try:
+            answer = replay_answer(self.title or "").strip()
+        except EOFError:
+            raise KeyboardInterrupt
+        if self.multi:
+            if answer == "*":
+                self.selection[:] = b"\x01" * len(self.selection)
+            else:
+                for item in filter(None, map(str.strip, answer.split(","))):
+                    self.selection[self.__index(item)] = 1
+        else:
+            self.pos = self.__index(answer) if answer else start_pos or 0
+        result = self.__set_result()
+        if print_result:
+            sys.stdout.write(f"  {self.title} {result}\n" if self.title is not None else f"  {result}\n")
+
+    def __set_result(self) -> str:
+        # sets `result` and returns the text that is printed for it
+        if not self.multi:
+            self.result = self.entries[self.pos]
+            return self.result
+        self.result = [entry for entry, selected in zip(self.entries, self.selection) if selected]
+        return ", ".join(self.result) if len(self.result) <= 5 else f"{len(self.result)} entries"
+
+    def __index(self, answer: str) -> int:
+        if answer in self.entries:
+            return self.entries.index(answer)
+        if answer.isdigit() and 1 <= int(answer) <= len(self.entries):
+            return int(answer) - 1
+        raise ValueError(f"{answer!r} is not an entry of the selector")
+
     def __up(self) -> None:
         self.pos = self.__highest_index if self.pos == 0 else self.pos - 1
 
@@ -102,11 +177,30 @@ class Selector:  # use sys.stdout.write instead of out here for performance reas
         sys.stdout.write("\r\x1b[s")
         flush()
         for i, entry in enumerate(self.entries):
-            sys.stdout.write(f"{self.__entry_prefix}\x1b[0m{entry}\n")
+            sys.stdout.write(f"{self.__entry_prefix}\x1b[0m{self.__mark(i)}{entry}\n")
             if i in self.__empty_line_indexes:
                 sys.stdout.write("\n")
         sys.stdout.write("\x1b[u")
 
+    def __repaint(self) -> None:
+        # repaint only the rows that fit into the console, with a single write
+        rows = []
+        row = 0
+        for i, entry in enumerate(self.entries):
+            if row >= self.__prev_terminal_size - 1:
+                break
+            rows.append(f"{self.__entry_prefix}\x1b[1K\x1b[0m{self.__mark(i)}{entry}\n")
+            row += 1
+            if i in self.__empty_line_indexes:
+                rows.append("\n")
+                row += 1
+        sys.stdout.write("\x1b[u" + "".join(rows) + "\x1b[u")
+
+    def __mark(self, i: int) -> str:
+        if self.selection is None:
+            return ""
+        return "\x1b[92m[x]\x1b[0m " if self.selection[i] else "[ ] "
+
     def __update(self) -> None:
         if self.__prev_terminal_size != os.get_terminal_size().lines:
             sys.stdout.write("\x1b[J")
@@ -116,13 +210,13 @@ class Selector:  # use sys.stdout.write instead of out here for performance reas
         if self.prev > 0:  # go to previous position
             sys.stdout.write(f"\x1b[{self.__real_pos(self.prev)}B")
         # print unselect position
-        sys.stdout.write(f"{self.__entry_prefix}\x1b[1K\x1b[0m{self.entries[self.prev]}")
+        sys.stdout.write(f"{self.__entry_prefix}\x1b[1K\x1b[0m{self.__mark(self.prev)}{self.entries[self.prev]}")
 
         sys.stdout.write("\x1b[u")
         if self.pos > 0:  # go to selected position
             sys.stdout.write(f"\x1b[{self.__real_pos(self.pos)}B")
         # print selected position
-        sys.stdout.write(f"  \x1b[97m{self.select} \x1b[96m{self.entries[self.pos]}\x1b[0m")
+        sys.stdout.write(f"  \x1b[97m{self.select} {self.__mark(self.pos)}\x1b[96m{self.entries[self.pos]}\x1b[0m")
 
         sys.stdout.write(f"\x1b[u")
         flush()